@@ -31,7 +31,7 @@ autoapi_member_order = "alphabetical"
 autoapi_dirs = ["../../src/torchoptics"]
 autoapi_type = "python"
 autoapi_add_toctree_entry = False
-autoapi_keep_files = False
+autoapi_keep_files = True  # Reuse the generated API sources across incremental builds
 autodoc_typehints = "description"
 autoapi_options = [
     "members",
@@ -51,6 +51,9 @@ sphinx_gallery_conf = {
     "reference_url": {"torchoptics": None},
     "filename_pattern": "^((?!sphinx_skip).)*$",  # Exclude files with 'sphinx_skip' in the name
     "matplotlib_animations": (True, "jshtml"),
+    "thumbnail_size": (320, 224),
+    "image_srcset": ["2x"],
+    "compress_images": ("images", "thumbnails"),  # Requires optipng
     "subsection_order": ExplicitOrder(
         [
             "../../examples/optical_phenomena",
@@ -75,7 +75,7 @@ plt.show()
 # ------------------
 # We create a delta-function point source to measure the PSF.
 
-point_source_data = torch.zeros(shape, shape)
+point_source_data = torch.zeros(shape, shape, device=device)
 point_source_data[shape // 2, shape // 2] = 1.0
 point_source = Field(point_source_data).to(device)
 
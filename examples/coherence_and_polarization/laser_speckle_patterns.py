@@ -128,14 +128,13 @@ plt.show()
 aperture_radii = [2e-3, 1e-3, 0.5e-3]
 fig, axes = plt.subplots(1, 3, figsize=(12, 4), constrained_layout=True)
 
-for ax, radius in zip(axes, aperture_radii):
-    # Circular aperture
-    aperture = circle(shape, radius)
-    scattered = aperture * torch.exp(1j * random_phase)
-    field = Field(scattered).to(device)
-    output = field.propagate_to_z(propagation_distance)
-
-    ax.imshow(output.intensity().cpu(), cmap="hot")
+# Stack the circular apertures into one batched field so all three propagate in a single FFT pass
+apertures = torch.stack([circle(shape, radius) for radius in aperture_radii])
+field = Field(apertures * torch.exp(1j * random_phase)).to(device)
+outputs = field.propagate_to_z(propagation_distance).intensity().cpu()
+
+for ax, radius, output in zip(axes, aperture_radii, outputs):
+    ax.imshow(output, cmap="hot")
     ax.set_title(f"Aperture r = {radius * 1e3:.1f} mm")
     ax.axis("off")
 
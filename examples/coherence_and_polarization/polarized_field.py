@@ -35,6 +35,9 @@ x_coords = torch.linspace(-extent_mm, extent_mm, shape)
 torchoptics.set_default_spacing(spacing)
 torchoptics.set_default_wavelength(wavelength)
 
+# Select computation device
+device = "cuda" if torch.cuda.is_available() else "cpu"
+
 # %%
 # Initializing a Polarized Field
 # ------------------------------
@@ -45,14 +48,14 @@ torchoptics.set_default_wavelength(wavelength)
 field_profile = gaussian(shape, waist_radius=beam_waist).real
 field_data = torch.zeros(3, shape, shape, dtype=field_profile.dtype)
 field_data[0] = field_profile
-field = Field(field_data).normalize()
+field = Field(field_data).normalize().to(device)
 
 # Plot the input field components along the center row.
 center_row = shape // 2
-input_profile = field.data[0].abs().square().cpu()[center_row, :]
+input_profile = field.data[0, center_row].abs().square().cpu()
 input_profile_max = input_profile.max()
 input_ex = input_profile / input_profile_max
-input_ey = field.data[1].abs().square().cpu()[center_row, :] / input_profile_max
+input_ey = field.data[1, center_row].abs().square().cpu() / input_profile_max
 
 fig, ax = plt.subplots(figsize=(8, 4))
 ax.plot(x_coords, input_ex, linewidth=2, label=r"$|E_x|^2$")
@@ -77,11 +80,19 @@ plt.show()
 #
 # where :math:`P_0` is the initial power, and :math:`\theta` is the angle between the
 # initial polarization and the polarizer’s axis.
+#
+# The polarization matrix of a :class:`~torchoptics.elements.LinearPolarizer` is
+# uniform across the plane, so a single grid point of each polarizer's matrix is
+# kept. The matrices for all angles are stacked and applied with
+# :meth:`~torchoptics.Field.polarized_modulate`, which multiplies uniform
+# matrices with the field directly in a single operation.
 
 angles = torch.linspace(0, 2 * torch.pi, 400)
-field_power = torch.tensor(
-    [LinearPolarizer(shape, theta=float(theta))(field).power().sum().item() for theta in angles]
-)
+polarizers = [LinearPolarizer(shape, theta=angle) for angle in angles]
+# Shape (400, 3, 3, 1, 1)
+polarizer_matrices = torch.stack([p.polarized_modulation_profile()[..., :1, :1] for p in polarizers])
+polarized_field = field.polarized_modulate(polarizer_matrices.to(device))  # Data shape (400, 3, H, W)
+field_power = polarized_field.power().sum(dim=-1).cpu()
 theory = torch.cos(angles) ** 2
 
 fig, ax = plt.subplots(figsize=(8, 4))
@@ -113,23 +124,24 @@ plt.show()
 # The first polarizer projects the field onto a new axis, enabling partial transmission through the second
 # polarizer.
 
-polarizer_0 = LinearPolarizer(shape, theta=0)
-polarizer_45 = LinearPolarizer(shape, theta=torch.pi / 4)
-polarizer_90 = LinearPolarizer(shape, theta=torch.pi / 2)
+polarizer_0 = LinearPolarizer(shape, theta=0).to(device)
+polarizer_45 = LinearPolarizer(shape, theta=torch.pi / 4).to(device)
+polarizer_90 = LinearPolarizer(shape, theta=torch.pi / 2).to(device)
 
 after_0 = polarizer_0(field)
 after_45 = polarizer_45(field)
 after_90 = polarizer_90(field)
-after_45_90 = polarizer_90(after_45)
+
+# Both polarizers are uniform across the plane, so their Jones matrices are multiplied once and the
+# combined matrix is applied to the field in a single pass
+jones_45 = polarizer_45.polarized_modulation_profile()[..., 0, 0]
+jones_90 = polarizer_90.polarized_modulation_profile()[..., 0, 0]
+after_45_90 = field.polarized_modulate((jones_90 @ jones_45)[..., None, None])
 
 stage_labels = ["Input", "0°", "45°", "90°", "45° → 90°"]
-stage_powers = [
-    field.power().sum().item(),
-    after_0.power().sum().item(),
-    after_45.power().sum().item(),
-    after_90.power().sum().item(),
-    after_45_90.power().sum().item(),
-]
+# The powers are stacked on the device and read back together
+stage_fields = [field, after_0, after_45, after_90, after_45_90]
+stage_powers = torch.stack([f.power().sum() for f in stage_fields]).tolist()
 
 print("Sequential Polarizer Experiment")
 for label, power in zip(stage_labels, stage_powers):
@@ -142,8 +154,8 @@ for label, power in zip(stage_labels, stage_powers):
 # polarization into circular polarization. A half-waveplate at the same angle
 # rotates the polarization axis by :math:`90°`.
 
-qwp_45 = QuarterWaveplate(shape, theta=torch.pi / 4)
-hwp_45 = HalfWaveplate(shape, theta=torch.pi / 4)
+qwp_45 = QuarterWaveplate(shape, theta=torch.pi / 4).to(device)
+hwp_45 = HalfWaveplate(shape, theta=torch.pi / 4).to(device)
 
 after_qwp = qwp_45(field)
 after_hwp = hwp_45(field)
@@ -164,18 +176,18 @@ for label, f, theory in [
 # Waveplate Rotation Sweep
 # ------------------------
 # Sweeping the quarter-waveplate axis angle tracks the circular polarization
-# content through the Stokes parameter :math:`S_3`.
+# content through the Stokes parameter :math:`S_3`. As in the Malus's law sweep,
+# the uniform waveplate matrices for all angles are stacked and applied at once.
+# Only the transverse entries of the first column act on the :math:`E_x` input and
+# are needed for :math:`S_3`.
 
 waveplate_angles = torch.linspace(0, torch.pi, 200)
-s3_values = []
-
-for theta in waveplate_angles:
-    qwp = QuarterWaveplate(shape, theta=float(theta))
-    out = qwp(field)
-    ex_out = out.data[0]
-    ey_out = out.data[1]
-    intensity = ex_out.abs().square() + ey_out.abs().square()
-    s3_values.append((2 * (ex_out * ey_out.conj()).imag / (intensity + 1e-12)).mean().item())
+cos, sin = torch.cos(waveplate_angles), torch.sin(waveplate_angles)
+# Shape (2, 200)
+qwp_column = torch.stack([cos**2 + 1j * sin**2, (1 - 1j) * cos * sin]).to(field.data.device, field.data.dtype)
+ex_out, ey_out = qwp_column[..., None, None] * field.data[0]  # Each of shape (200, H, W)
+intensity = ex_out.abs().square() + ey_out.abs().square()
+s3_values = (2 * (ex_out * ey_out.conj()).imag / (intensity + 1e-12)).mean(dim=(-2, -1)).cpu()
 
 fig, ax = plt.subplots(figsize=(8, 4))
 ax.plot(waveplate_angles, s3_values, color="#3498db", linewidth=2)
@@ -22,6 +22,7 @@ upon propagation.
 # sphinx_gallery_thumbnail_number = 1
 # sphinx_gallery_end_ignore
 
+import matplotlib.pyplot as plt
 import torch
 
 import torchoptics
@@ -78,6 +79,15 @@ high_spatial_coherence = SpatialCoherence(gsm(shape, waist_radius, high_coherenc
 
 propagation_distances = [0, 0.01, 0.02]
 
-for z in propagation_distances:
-    low_spatial_coherence.propagate_to_z(z).visualize(title=f"Low Coherence at z = {z} m", vmin=0)
-    high_spatial_coherence.propagate_to_z(z).visualize(title=f"High Coherence at z = {z} m", vmin=0)
+fig, axes = plt.subplots(2, 3, figsize=(12, 8), constrained_layout=True)
+for col, z in enumerate(propagation_distances):
+    for row, (label, spatial_coherence) in enumerate(
+        [("Low", low_spatial_coherence), ("High", high_spatial_coherence)]
+    ):
+        # The 30-point grid has an ASM critical distance of about 8 mm, so "AUTO" selects direct
+        # integration for the farther planes
+        intensity = spatial_coherence.propagate_to_z(z).intensity().cpu()
+        axes[row, col].imshow(intensity, cmap="inferno", vmin=0)
+        axes[row, col].set_title(f"{label} Coherence at z = {z} m")
+        axes[row, col].axis("off")
+plt.show()
@@ -14,11 +14,14 @@ Fresnel (near-field) to Fraunhofer (far-field) regime.
 # sphinx_gallery_thumbnail_number = 1
 # sphinx_gallery_end_ignore
 
+import os
+
 import torch
 
 import torchoptics
-from torchoptics import Field, animate_tensor
+from torchoptics import Field, animate_tensor, visualize_tensor
 from torchoptics.profiles import octagon
+from torchoptics.propagation import calculate_critical_propagation_distance
 
 # %%
 # Simulation Parameters
@@ -33,24 +36,49 @@ aperture_radius = 1.5e-3  # Octagon circumradius (m)
 torchoptics.set_default_spacing(spacing)
 torchoptics.set_default_wavelength(wavelength)
 
+# Select computation device
+device = "cuda" if torch.cuda.is_available() else "cpu"
+
+# Set TORCHOPTICS_SKIP_ANIM=1 to show only the final frame instead of rendering the animation
+SKIP_ANIMATION = os.environ.get("TORCHOPTICS_SKIP_ANIM", "0") == "1"
+
 # %%
 # Input Field: Octagonal Aperture
 # --------------------------------
 # A uniform plane wave transmitted through an octagonal aperture serves as the
 # input. The sharp edges produce rich diffraction features during propagation.
 
-field = Field(octagon(shape, radius=aperture_radius))
+field = Field(octagon(shape, radius=aperture_radius)).to(device)
 field.visualize(title="Octagonal Aperture (z = 0)")
 
 # %%
 # Propagation Animation
 # ---------------------
 # We propagate the field from :math:`z = 0` to :math:`z = 2` m and collect the
-# intensity at each plane. The animation reveals how the sharp aperture edges
-# produce Fresnel fringes that gradually evolve into the far-field pattern.
+# intensity at each plane. Below the critical distance :math:`z_c` of the angular
+# spectrum method, :meth:`~torchoptics.Field.propagate_to_zs` transforms the field
+# once and propagates to the planes in small batches. Beyond :math:`z_c` the
+# angular spectrum method aliases, so the remaining planes use
+# :meth:`~torchoptics.Field.propagate_to_z`, whose default ``"AUTO"`` method
+# switches to direct integration. The animation reveals how the sharp aperture
+# edges produce Fresnel fringes that gradually evolve into the far-field pattern.
 
-z_values = torch.linspace(0, 2, 101)
-intensities = torch.stack([field.propagate_to_z(z).intensity() for z in z_values])
+z_values = torch.linspace(0, 2, 101, device=device)
+critical_z = calculate_critical_propagation_distance(field, field).min()
+near = z_values < critical_z
+intensities = torch.cat(
+    [
+        field.propagate_to_zs(z_values[near], batch_size=4).abs().square(),
+        torch.stack([field.propagate_to_z(z).intensity() for z in z_values[~near]]),
+    ]
+)
 
-titles = [f"z = {z:.2f} m" for z in z_values]
-animate_tensor(intensities, vmax=2, title=titles, func_anim_kwargs={"interval": 100})
+if SKIP_ANIMATION:
+    visualize_tensor(intensities[-1], vmax=2, title=f"z = {z_values[-1]:.2f} m")
+else:
+    animate_tensor(
+        intensities,
+        vmax=2,
+        title=lambda frame: f"z = {z_values[frame]:.2f} m",
+        func_anim_kwargs={"interval": 100},
+    )
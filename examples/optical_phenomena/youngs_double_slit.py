@@ -80,10 +80,9 @@ for z in propagation_distances:
 
 z_screen = 0.15  # Screen distance (m)
 output_field = input_field.propagate_to_z(z_screen)
-intensity = output_field.intensity().cpu()
 
-# Take center row cross-section
-center_row = intensity[shape // 2, :]
+# Take center row cross-section, slicing on the device so only the row is copied to the host
+center_row = output_field.intensity()[shape // 2, :].cpu()
 x = torch.linspace(-spacing * (shape - 1) / 2, spacing * (shape - 1) / 2, shape)
 
 # Theoretical pattern: sinc² (single-slit envelope) × cos² (double-slit fringes)
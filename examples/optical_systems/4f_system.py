@@ -22,9 +22,11 @@ The five key planes have distinct physical meanings:
 
 # sphinx_gallery_start_ignore
 # sphinx_gallery_multi_image = "single"
-# sphinx_gallery_thumbnail_number = 4
+# sphinx_gallery_thumbnail_number = 3
 # sphinx_gallery_end_ignore
 
+import os
+
 import matplotlib.pyplot as plt
 import torch
 
@@ -39,8 +41,8 @@ from torchoptics.profiles import checkerboard, circle
 # A checkerboard input field tests both low- and high-frequency response,
 # since a checkerboard contains spatial frequencies near its fundamental tile period.
 
-shape = 500  # Grid size (number of points per dimension)
-spacing = 10e-6  # Grid spacing (m)
+shape = int(os.environ.get("TORCHOPTICS_GALLERY_SHAPE", 500))  # Grid size (number of points per dimension)
+spacing = 10e-6 * 500 / shape  # Grid spacing (m), scaled with shape to keep a 5 mm field of view
 wavelength = 700e-9  # Wavelength (m)
 focal_length = 50e-3  # Lens focal length (m)
 
@@ -49,6 +51,9 @@ num_tiles = 15  # Number of tiles in each dimension
 
 device = "cuda" if torch.cuda.is_available() else "cpu"
 
+# The filter profile previews are only rendered when TORCHOPTICS_ALL_FIGS=1
+SHOW_ALL_FIGURES = os.environ.get("TORCHOPTICS_ALL_FIGS", "0") == "1"
+
 torchoptics.set_default_spacing(spacing)
 torchoptics.set_default_wavelength(wavelength)
 
@@ -70,19 +75,26 @@ visualize_tensor(input_field.intensity(), title="Input Field: Checkerboard")
 # (z = 2f), front focal plane (z = 3f), and output (z = 4f).
 
 fig, axes = plt.subplots(1, 5, figsize=(18, 4.5), constrained_layout=True)
-system = System(
-    Lens(shape, focal_length, z=1 * focal_length),
-    Lens(shape, focal_length, z=3 * focal_length),
-).to(device)
-
-for i in range(5):
-    plane_z = i * focal_length
-    image = system.measure_at_z(input_field, z=plane_z).intensity().cpu()
+lens1 = Lens(shape, focal_length, z=1 * focal_length).to(device)
+lens2 = Lens(shape, focal_length, z=3 * focal_length).to(device)
+system = System(lens1, lens2)
+
+plane_zs = [i * focal_length for i in range(5)]
+images = list(system.measure_at_zs(input_field, plane_zs).abs().square().cpu())
+for i, image in enumerate(images):
     axes[i].imshow(image, cmap="inferno", vmin=0, vmax=1)
     axes[i].set_title(f"z = {i}f")
     axes[i].axis("off")
 plt.show()
 
+# %%
+# The filters below only act at the Fourier plane, so the field leaving the first
+# lens is the same for every system. It is computed once and reused as the input
+# to the filtered systems, along with the images of the first two planes. The
+# second lens is shared by all systems rather than rebuilt for each one.
+
+field_after_lens = lens1(input_field.propagate_to_z(focal_length))
+
 # %%
 # Spatial Filtering: Low-Pass Filter
 # ------------------------------------
@@ -94,18 +106,17 @@ radius = 200e-6  # Low-pass filter radius in the Fourier plane (m)
 low_pass_profile = circle(shape, radius)
 
 low_pass_4f_system = System(
-    Lens(shape, focal_length, z=1 * focal_length),
-    Modulator(low_pass_profile, z=2 * focal_length),
-    Lens(shape, focal_length, z=3 * focal_length),
-).to(device)
+    Modulator(low_pass_profile, z=2 * focal_length).to(device),
+    lens2,
+)
 
-low_pass_4f_system[1].visualize(title="Low-Pass Filter Profile\n(Circular Aperture in Fourier Plane)")
+if SHOW_ALL_FIGURES:
+    low_pass_4f_system[0].visualize(title="Low-Pass Filter Profile\n(Circular Aperture in Fourier Plane)")
 
 # %%
 fig, axes = plt.subplots(1, 5, figsize=(18, 4.5), constrained_layout=True)
-for i in range(5):
-    plane_z = i * focal_length
-    image = low_pass_4f_system.measure_at_z(input_field, z=plane_z).intensity().cpu()
+filtered_images = list(low_pass_4f_system.measure_at_zs(field_after_lens, plane_zs[2:]).abs().square().cpu())
+for i, image in enumerate(images[:2] + filtered_images):
     axes[i].imshow(image, cmap="inferno", vmin=0, vmax=1)
     axes[i].set_title(f"z = {i}f")
     axes[i].axis("off")
@@ -122,18 +133,17 @@ plt.show()
 high_pass_profile = 1 - low_pass_profile
 
 high_pass_system = System(
-    Lens(shape, focal_length, z=1 * focal_length),
-    Modulator(high_pass_profile, z=2 * focal_length),
-    Lens(shape, focal_length, z=3 * focal_length),
-).to(device)
+    Modulator(high_pass_profile, z=2 * focal_length).to(device),
+    lens2,
+)
 
-high_pass_system[1].visualize(title="High-Pass Filter Profile\n(Central Block in Fourier Plane)")
+if SHOW_ALL_FIGURES:
+    high_pass_system[0].visualize(title="High-Pass Filter Profile\n(Central Block in Fourier Plane)")
 
 # %%
 fig, axes = plt.subplots(1, 5, figsize=(18, 4.5), constrained_layout=True)
-for i in range(5):
-    plane_z = i * focal_length
-    image = high_pass_system.measure_at_z(input_field, z=plane_z).intensity().cpu()
+filtered_images = list(high_pass_system.measure_at_zs(field_after_lens, plane_zs[2:]).abs().square().cpu())
+for i, image in enumerate(images[:2] + filtered_images):
     axes[i].imshow(image, cmap="inferno", vmin=0, vmax=1)
     axes[i].set_title(f"z = {i}f")
     axes[i].axis("off")
@@ -20,6 +20,7 @@ import torchoptics
 from torchoptics import Field, System, visualize_tensor
 from torchoptics.elements import Lens
 from torchoptics.profiles import gaussian
+from torchoptics.propagation import calculate_critical_propagation_distance
 
 # %%
 # Simulation Parameters
@@ -94,13 +95,18 @@ focal_lengths = [100e-3, 150e-3, 200e-3]  # Focal lengths to compare (m)
 
 fig, ax = plt.subplots(figsize=(8, 4), constrained_layout=True)
 
-z_positions = torch.linspace(0, 300e-3, 51)
+z_positions = torch.linspace(0, 300e-3, 51, device=device)
 
 for f in focal_lengths:
     after_lens_f = System(Lens(shape, focal_length=f, z=0)).to(device)(input_field)
-    waists_x = [2 * after_lens_f.propagate_to_z(z).std().cpu()[1] for z in z_positions]
+    # Planes below the critical distance of the angular spectrum method share one forward FFT of the field
+    # after the lens. Beyond it, propagate_to_z selects direct integration.
+    near = z_positions < calculate_critical_propagation_distance(after_lens_f, after_lens_f).min()
+    near_planes = after_lens_f.copy(data=after_lens_f.propagate_to_zs(z_positions[near], batch_size=4))
+    far_stds = [after_lens_f.propagate_to_z(z).std() for z in z_positions[~near]]
+    waists_x = 2 * torch.cat([near_planes.std(), torch.stack(far_stds)]).cpu()[:, 1]
     w_theory = wavelength * f / (torch.pi * beam_waist)
-    ax.plot(z_positions * 1e3, torch.stack(waists_x) * 1e6, label=f"f = {f * 1e3:.0f} mm")
+    ax.plot(z_positions.cpu() * 1e3, waists_x * 1e6, label=f"f = {f * 1e3:.0f} mm")
     ax.axvline(f * 1e3, color="gray", linestyle=":", linewidth=0.8)
     ax.annotate(
         f"{w_theory * 1e6:.1f} µm",
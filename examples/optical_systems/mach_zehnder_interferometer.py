@@ -62,21 +62,22 @@ visualize_tensor(input_field.intensity(), title="Input Gaussian Beam")
 
 num_phases = 200
 phase_values = torch.linspace(0, 2 * torch.pi, num_phases)
-port1_power = []
-port2_power = []
 
-for phi in phase_values:
-    # Split
-    arm1, arm2 = bs1(input_field)
+chunk_size = 25  # Phases evaluated at once, which bounds the memory of the batched fields
 
-    # Phase shift in arm 2
-    arm2 = arm2.modulate(torch.exp(1j * phi) * torch.ones(shape, shape))
+# Split
+arm1, arm2 = bs1(input_field)
+
+port1_power, port2_power = [], []
+for phases in phase_values.split(chunk_size):
+    # Phase shift in arm 2, with a chunk of phases evaluated at once along a leading batch dimension
+    shifted_arm2 = arm2.modulate(torch.exp(1j * phases)[:, None, None])
 
     # Recombine
-    out1, out2 = bs2(arm1, arm2)
+    out1, out2 = bs2(arm1, shifted_arm2)
 
-    port1_power.append(out1.power().sum().item())
-    port2_power.append(out2.power().sum().item())
+    port1_power += out1.power().tolist()
+    port2_power += out2.power().tolist()
 
 fig, ax = plt.subplots(figsize=(8, 4))
 ax.plot(phase_values, port1_power, label="Output Port 1", color="#e74c3c", linewidth=2)
@@ -77,17 +77,20 @@ def create_phase_hologram(desired_field, grating_period):
     def inverse_sinc(y):
         # Approximate inverse of sinc(πx) for x ∈ [−π, 0], adapted from:
         # https://math.stackexchange.com/a/3345578
+        # Intermediates are updated in place to avoid allocating a new grid for every operation.
         z = 1 - y
-        return -torch.sqrt(12 * z / (1 - 0.20409 * z + torch.sqrt(1 - 0.792 * z - 0.0318 * z**2)))
+        denominator = torch.sqrt(1 - 0.792 * z - 0.0318 * z**2).add_(1 - 0.20409 * z)
+        return z.mul_(12).div_(denominator).sqrt_().neg_()
 
     angle = torch.angle(desired_field)
     amplitude = torch.abs(desired_field)
-    amplitude /= torch.max(amplitude)  # Normalize amplitude to [0, 1]
+    amplitude /= amplitude.amax()  # Normalize amplitude to [0, 1]
 
-    M = 1 + 1 / torch.pi * inverse_sinc(amplitude)
-    F = angle - torch.pi * M
-    m = torch.arange(desired_field.shape[0]) * spacing
-    return M * ((F + 2 * torch.pi * m / grating_period) % (2 * torch.pi))
+    M = inverse_sinc(amplitude).div_(torch.pi).add_(1)
+    F = angle.sub_(torch.pi * M)
+    m = torch.arange(desired_field.shape[0], device=desired_field.device) * spacing
+    ramp = 2 * torch.pi * m / grating_period  # Blazed grating phase along the last dimension
+    return F.add_(ramp).remainder_(2 * torch.pi).mul_(M)
 
 
 # %%
@@ -101,14 +104,15 @@ phase_modulator.visualize(title="Phase-Only Hologram")
 # ----------------------
 # Construct a 2f system: phase modulator → lens → focal plane (2f).
 
-system = System(phase_modulator, Lens(shape, focal_length, z=focal_length)).to(device)
+lens1 = Lens(shape, focal_length, z=focal_length).to(device)
+system = System(phase_modulator, lens1)
 
 # Input is a uniform plane wave
-input_field = Field(torch.ones(shape, shape)).to(device)
+input_field = Field(torch.ones(shape, shape, device=device)).to(device)
 
 # Measure the output field at z = 2f
-output_field = system.measure_at_z(input_field, z=2 * focal_length)
-visualize_tensor(output_field.intensity(), title="Output Field at 2f", vmax=1)
+focal_field = system.measure_at_z(input_field, z=2 * focal_length)
+visualize_tensor(focal_field.intensity(), title="Output Field at 2f", vmax=1)
 
 # %%
 # Circular Aperture at 2f Plane
@@ -124,15 +128,13 @@ circular_aperture.visualize(title="Circular Aperture at 2f")
 # %%
 # 4f System: Modulator → Lens → Aperture → Lens
 # ---------------------------------------------
-# Extend the system to include an aperture and a second lens.
+# Extend the system to include an aperture and a second lens. The field at the
+# 2f plane was already computed by the 2f system, so only the aperture and the
+# second lens are applied to it rather than propagating through the first half again.
 # Measure the field at the output plane (4f).
 
-extended_system = System(
-    phase_modulator,
-    Lens(shape, focal_length, z=focal_length),
-    circular_aperture,
-    Lens(shape, focal_length, z=3 * focal_length),
-).to(device)
+lens2 = Lens(shape, focal_length, z=3 * focal_length).to(device)
+second_half = System(circular_aperture, lens2)
 
-output_field = extended_system.measure_at_z(input_field, z=4 * focal_length)
+output_field = second_half.measure_at_z(focal_field, z=4 * focal_length)
 visualize_tensor(output_field.intensity(), title="Final Output Field at 4f")
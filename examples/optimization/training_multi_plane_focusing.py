@@ -125,9 +125,9 @@ phase_modulator = PhaseModulator(Parameter(torch.zeros(shape, shape)), z=0).to(d
 optimizer = torch.optim.Adam(phase_modulator.parameters(), lr=0.1)
 num_iterations = 100
 
-losses = []
-losses_plane1 = []
-losses_plane2 = []
+# The total and per-plane losses are written into a preallocated device tensor, so only the progress prints
+# read values back to the host during training.
+loss_history = torch.empty(num_iterations, 3, dtype=target_1.data.real.dtype, device=device)
 
 for iteration in range(num_iterations):
     optimizer.zero_grad()
@@ -150,16 +150,17 @@ for iteration in range(num_iterations):
     loss.backward()
     optimizer.step()
 
-    losses.append(loss.item())
-    losses_plane1.append(loss_1.item())
-    losses_plane2.append(loss_2.item())
+    loss_history[iteration] = torch.stack([loss, loss_1, loss_2]).detach()
 
     if iteration % 50 == 0:
+        total_value, plane1_value, plane2_value = loss_history[iteration].tolist()
         print(
-            f"Iteration {iteration}: Total Loss = {loss.item():.4f}, "
-            f"Plane 1 = {loss_1.item():.4f}, Plane 2 = {loss_2.item():.4f}"
+            f"Iteration {iteration}: Total Loss = {total_value:.4f}, "
+            f"Plane 1 = {plane1_value:.4f}, Plane 2 = {plane2_value:.4f}"
         )
 
+losses, losses_plane1, losses_plane2 = loss_history.cpu().T.tolist()
+
 # %%
 # Training Convergence
 # --------------------
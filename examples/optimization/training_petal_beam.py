@@ -23,6 +23,8 @@ across the propagation planes.
 # sphinx_gallery_thumbnail_number = 1
 # sphinx_gallery_end_ignore
 
+import os
+
 import matplotlib.animation as animation
 import matplotlib.pyplot as plt
 import torch
@@ -92,10 +94,18 @@ system = System(
 # We optimize the three phase modulators jointly with Adam.
 
 optimizer = torch.optim.Adam(system.parameters(), lr=0.05)
-losses = []
-frames = []  # Snapshots for animation
 num_iterations = 100
 
+# Losses are written into a preallocated device tensor, so only the progress prints read values back to the
+# host during training.
+loss_history = torch.empty(num_iterations, dtype=target_field.data.real.dtype, device=device)
+
+# Preallocated snapshots for the animation, indexed by iteration. On a GPU the buffers are pinned so the
+# snapshot copies run asynchronously while the next iteration is computed.
+pin_memory = device == "cuda"
+phase_frames = torch.empty(num_iterations, len(system), shape, shape, pin_memory=pin_memory)
+output_frames = torch.empty(num_iterations, shape, shape, pin_memory=pin_memory)
+
 for iteration in range(num_iterations):
     optimizer.zero_grad()
     output_field = system.measure_at_z(input_field, 0.8)
@@ -103,16 +113,17 @@ for iteration in range(num_iterations):
     loss.backward()
     optimizer.step()
 
-    losses.append(loss.item())
-    frames.append(
-        {
-            "iteration": iteration,
-            "phases": [elem.phase.detach().cpu().clone() for elem in system.sorted_elements()],  # type: ignore[union-attr]
-            "output": output_field.intensity().detach().cpu(),
-        }
-    )
+    loss_history[iteration] = loss.detach()
+    for i, element in enumerate(system.sorted_elements()):
+        phase = element.phase.detach()  # type: ignore[union-attr]
+        phase_frames[iteration, i].copy_(phase, non_blocking=True)
+    output_frames[iteration].copy_(output_field.intensity().detach(), non_blocking=True)
     if iteration % 20 == 0:
-        print(f"Iteration {iteration}, Loss: {losses[-1]:.4f}")
+        print(f"Iteration {iteration}, Loss: {loss.item():.4f}")
+
+if device == "cuda":
+    torch.cuda.synchronize()  # Wait for the last snapshot copies before the frames are read
+losses = loss_history.cpu().tolist()
 
 # %%
 # Loss Curve
@@ -152,7 +163,7 @@ visualize_tensor(output_field.intensity(), title="Output Field")
 
 bounds = input_field.bounds().tolist()
 extent = [b * 1e3 for b in bounds]
-output_max = max(frame["output"].max().item() for frame in frames)
+output_max = output_frames.max().item()
 
 fig, axes = plt.subplots(
     1, 5, figsize=(18, 3.6), dpi=80, gridspec_kw={"width_ratios": [1, 1, 1, 1, 1.15], "wspace": 0.04}
@@ -162,14 +173,14 @@ titles = ["Phase Layer 1", "Phase Layer 2", "Phase Layer 3", "Output", "Loss"]
 # Phase and intensity panels
 ims = []
 for i in range(3):
-    phase = frames[0]["phases"][i] % (2 * torch.pi)
+    phase = phase_frames[0, i] % (2 * torch.pi)
     im = axes[i].imshow(phase, cmap="twilight", vmin=0, vmax=2 * torch.pi, extent=extent, origin="lower")
     axes[i].set_title(titles[i], fontsize=10)
     axes[i].axis("off")
     ims.append(im)
 
 im_out = axes[3].imshow(
-    frames[0]["output"], cmap="inferno", vmin=0, vmax=output_max, extent=extent, origin="lower"
+    output_frames[0], cmap="inferno", vmin=0, vmax=output_max, extent=extent, origin="lower"
 )
 axes[3].set_title("Output", fontsize=10)
 axes[3].axis("off")
@@ -190,14 +201,17 @@ fig.subplots_adjust(left=0.02, right=0.98, top=0.86, bottom=0.10, wspace=0.05)
 
 
 def update(frame_idx):
-    frame = frames[frame_idx]
     for i in range(3):
-        ims[i].set_data(frame["phases"][i] % (2 * torch.pi))
-    im_out.set_data(frame["output"])
-    it = frame["iteration"]
-    loss_marker.set_data([it], [losses[frame_idx]])
+        ims[i].set_data(phase_frames[frame_idx, i] % (2 * torch.pi))
+    im_out.set_data(output_frames[frame_idx])
+    loss_marker.set_data([frame_idx], [losses[frame_idx]])
+    epoch_text.set_text(f"Iteration {frame_idx}")
     return ims + [im_out, epoch_text, loss_marker]
 
 
-anim = animation.FuncAnimation(fig, update, frames=len(frames), interval=100, blit=True)
+# Set TORCHOPTICS_SKIP_ANIM=1 to show only the final training state instead of rendering the animation
+if os.environ.get("TORCHOPTICS_SKIP_ANIM", "0") == "1":
+    update(num_iterations - 1)
+else:
+    anim = animation.FuncAnimation(fig, update, frames=num_iterations, interval=100, blit=True)
 plt.show()
@@ -86,12 +86,14 @@ class BeamSplitter(Element):
 
         """
         self.validate_field(field)
-        output_data0 = field.data * self.transfer_matrix[0, 0]
-        output_data1 = field.data * self.transfer_matrix[1, 0]
+        transfer_matrix = self.transfer_matrix
+        output_data0 = field.data * transfer_matrix[0, 0]
+        output_data1 = field.data * transfer_matrix[1, 0]
         if other:
             self.validate_field(other)
-            output_data0 += other.data * self.transfer_matrix[0, 1]
-            output_data1 += other.data * self.transfer_matrix[1, 1]
+            # Out-of-place addition so that the two inputs may have different (broadcastable) batch shapes
+            output_data0 = output_data0 + other.data * transfer_matrix[0, 1]
+            output_data1 = output_data1 + other.data * transfer_matrix[1, 1]
 
         return field.copy(data=output_data0), field.copy(data=output_data1)
 
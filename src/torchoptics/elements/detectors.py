@@ -1,6 +1,9 @@
 """Detector elements."""
 
-from matplotlib.figure import Figure
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from torch import Tensor
 from torch.nn.functional import linear
 
@@ -9,6 +12,9 @@ from ..types import Scalar, Vector2
 from ..utils import validate_tensor_ndim
 from .elements import Element
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 class Detector(Element):
     r"""Detector element.
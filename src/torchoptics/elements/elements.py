@@ -1,14 +1,19 @@
 """Base classes for the optical elements."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from matplotlib.figure import Figure
 from torch import Tensor
 
 from ..fields import Field
 from ..planar_grid import PlanarGrid
 from ..types import Scalar
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 class Element(PlanarGrid):
     """Base class for optical elements.
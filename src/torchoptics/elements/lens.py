@@ -49,7 +49,7 @@ class Lens(PolychromaticModulationElement):
         phase = lens_phase(self.shape, self.focal_length, wavelength, self.spacing)
         radius = self.length().min() / 2
         amplitude = circle(self.shape, radius, self.spacing)
-        return amplitude * torch.exp(1j * phase)
+        return torch.polar(amplitude.to(phase.dtype), phase)
 
 
 class CylindricalLens(PolychromaticModulationElement):
@@ -97,4 +97,4 @@ class CylindricalLens(PolychromaticModulationElement):
         phase = cylindrical_lens_phase(self.shape, self.focal_length, self.theta, wavelength, self.spacing)
         radius = self.length().min() / 2
         amplitude = circle(self.shape, radius, self.spacing)
-        return amplitude * torch.exp(1j * phase)
+        return torch.polar(amplitude.to(phase.dtype), phase)
@@ -5,6 +5,7 @@ from collections.abc import Callable
 import torch
 from torch import Tensor
 
+from ..fields import Field
 from ..types import Scalar, Vector2
 from ..utils import validate_tensor_ndim, wavelength_or_default
 from .elements import ModulationElement, PolychromaticModulationElement
@@ -73,7 +74,7 @@ class PhaseModulator(ModulationElement):
 
     def modulation_profile(self) -> Tensor:
         """Return the modulation profile."""
-        return torch.exp(1j * self.phase)
+        return torch.polar(torch.ones_like(self.phase), self.phase)  # Real cos/sin, no complex exponential
 
 
 class AmplitudeModulator(ModulationElement):
@@ -108,6 +109,25 @@ class AmplitudeModulator(ModulationElement):
         """Return the modulation profile."""
         return self.amplitude + 0j
 
+    def forward(self, field: Field) -> Field:
+        """Modulate the field.
+
+        The real amplitude is multiplied with the field directly, which avoids building the complex
+        modulation profile and performing a complex-by-complex multiplication. Subclasses that override
+        :meth:`modulation_profile` are modulated by their profile instead.
+
+        Args:
+            field (Field): The field to modulate.
+
+        Returns:
+            Field: The modulated field.
+
+        """
+        if type(self).modulation_profile is not AmplitudeModulator.modulation_profile:
+            return super().forward(field)
+        self.validate_field(field)
+        return field.modulate(self.amplitude)
+
 
 class PolychromaticPhaseModulator(PolychromaticModulationElement):
     r"""Phase-only modulator element that modulates the optical field based on physical thickness.
@@ -157,4 +177,5 @@ class PolychromaticPhaseModulator(PolychromaticModulationElement):
         """Return the modulation profile."""
         wavelength = wavelength_or_default(wavelength)
         n = self.n(wavelength) if callable(self.n) else self.n
-        return torch.exp(2j * torch.pi / wavelength * (n - 1) * self.thickness)
+        phase = 2 * torch.pi / wavelength * (n - 1) * self.thickness
+        return torch.polar(torch.ones_like(phase), phase)
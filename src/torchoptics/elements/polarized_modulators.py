@@ -71,7 +71,7 @@ class PolarizedPhaseModulator(PolarizedModulationElement):
 
     def polarized_modulation_profile(self) -> Tensor:
         """Return the polarized modulation profile."""
-        return torch.exp(1j * self.phase)
+        return torch.polar(torch.ones_like(self.phase), self.phase)
 
 
 class PolarizedAmplitudeModulator(PolarizedModulationElement):
@@ -48,13 +48,14 @@ class LinearPolarizer(PolarizedModulationElement):
 
     def polarized_modulation_profile(self) -> Tensor:
         """Return the polarized modulation profile."""
-        tensor = torch.zeros(3, 3, *self.shape, device=next(self.buffers()).device) + 0j
+        tensor = torch.zeros(3, 3, device=next(self.buffers()).device) + 0j
         tensor[0, 0] = torch.cos(self.theta) ** 2
         tensor[0, 1] = torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 0] = torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 1] = torch.sin(self.theta) ** 2
         tensor[2, 2] = 1
-        return tensor
+        # The matrix is spatially uniform, so it is expanded over the grid without copying
+        return tensor.unsqueeze(-1).unsqueeze(-1).expand(3, 3, *self.shape)
 
 
 class LeftCircularPolarizer(PolarizedModulationElement):
@@ -81,13 +82,13 @@ class LeftCircularPolarizer(PolarizedModulationElement):
 
     def polarized_modulation_profile(self) -> Tensor:
         """Return the polarized modulation profile."""
-        tensor = torch.zeros(3, 3, *self.shape, device=next(self.buffers()).device) + 0j
+        tensor = torch.zeros(3, 3, device=next(self.buffers()).device) + 0j
         tensor[0, 0] = 0.5
         tensor[0, 1] = -0.5j  # type: ignore[assignment]
         tensor[1, 0] = 0.5j  # type: ignore[assignment]
         tensor[1, 1] = 0.5
         tensor[2, 2] = 1
-        return tensor
+        return tensor.unsqueeze(-1).unsqueeze(-1).expand(3, 3, *self.shape)
 
 
 class RightCircularPolarizer(PolarizedModulationElement):
@@ -114,10 +115,10 @@ class RightCircularPolarizer(PolarizedModulationElement):
 
     def polarized_modulation_profile(self) -> Tensor:
         """Return the polarized modulation profile."""
-        tensor = torch.zeros(3, 3, *self.shape, device=next(self.buffers()).device) + 0j
+        tensor = torch.zeros(3, 3, device=next(self.buffers()).device) + 0j
         tensor[0, 0] = 0.5
         tensor[0, 1] = 0.5j  # type: ignore[assignment]
         tensor[1, 0] = -0.5j  # type: ignore[assignment]
         tensor[1, 1] = 0.5
         tensor[2, 2] = 1
-        return tensor
+        return tensor.unsqueeze(-1).unsqueeze(-1).expand(3, 3, *self.shape)
@@ -59,13 +59,14 @@ class Waveplate(PolarizedModulationElement):
 
     def polarized_modulation_profile(self) -> Tensor:
         """Return the polarized modulation profile."""
-        tensor = torch.zeros(3, 3, *self.shape, device=next(self.buffers()).device) + 0j
+        tensor = torch.zeros(3, 3, device=next(self.buffers()).device) + 0j
         tensor[0, 0] = torch.cos(self.theta) ** 2 + torch.exp(1j * self.phi) * torch.sin(self.theta) ** 2
         tensor[0, 1] = (1 - torch.exp(1j * self.phi)) * torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 0] = (1 - torch.exp(1j * self.phi)) * torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 1] = torch.sin(self.theta) ** 2 + torch.exp(1j * self.phi) * torch.cos(self.theta) ** 2
         tensor[2, 2] = 1
-        return tensor
+        # The matrix is spatially uniform, so it is expanded over the grid without copying
+        return tensor.unsqueeze(-1).unsqueeze(-1).expand(3, 3, *self.shape)
 
 
 class QuarterWaveplate(PolarizedModulationElement):
@@ -110,13 +111,13 @@ class QuarterWaveplate(PolarizedModulationElement):
 
     def polarized_modulation_profile(self) -> Tensor:
         """Return the polarized modulation profile."""
-        tensor = torch.zeros(3, 3, *self.shape, device=next(self.buffers()).device) + 0j
+        tensor = torch.zeros(3, 3, device=next(self.buffers()).device) + 0j
         tensor[0, 0] = torch.cos(self.theta) ** 2 + 1j * torch.sin(self.theta) ** 2
         tensor[0, 1] = (1 - 1j) * torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 0] = (1 - 1j) * torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 1] = torch.sin(self.theta) ** 2 + 1j * torch.cos(self.theta) ** 2
         tensor[2, 2] = 1
-        return tensor
+        return tensor.unsqueeze(-1).unsqueeze(-1).expand(3, 3, *self.shape)
 
 
 class HalfWaveplate(PolarizedModulationElement):
@@ -161,10 +162,10 @@ class HalfWaveplate(PolarizedModulationElement):
 
     def polarized_modulation_profile(self) -> Tensor:
         """Return the polarized modulation profile."""
-        tensor = torch.zeros(3, 3, *self.shape, device=next(self.buffers()).device) + 0j
+        tensor = torch.zeros(3, 3, device=next(self.buffers()).device) + 0j
         tensor[0, 0] = torch.cos(self.theta) ** 2 - torch.sin(self.theta) ** 2
         tensor[0, 1] = 2 * torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 0] = 2 * torch.cos(self.theta) * torch.sin(self.theta)
         tensor[1, 1] = torch.sin(self.theta) ** 2 - torch.cos(self.theta) ** 2
         tensor[2, 2] = 1
-        return tensor
+        return tensor.unsqueeze(-1).unsqueeze(-1).expand(3, 3, *self.shape)
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import torch
-from matplotlib.figure import Figure
 from torch import Tensor
 
 from .functional import meshgrid2d
@@ -14,6 +13,8 @@ from .utils import initialize_shape, spacing_or_default
 from .visualization import visualize_tensor
 
 if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
     from .types import Scalar, Vector2
 
 
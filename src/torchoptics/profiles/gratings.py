@@ -95,7 +95,8 @@ def blazed_grating(
     theta = initialize_tensor("theta", theta, is_scalar=True)
     x, y = profile_meshgrid(shape, spacing, offset)
 
-    grating = ((x * torch.cos(theta) + y * torch.sin(theta)) / period) % 1
+    # Fold the period into the 0-D direction cosines so the grid is only traversed by the multiply-adds
+    grating = (x * (torch.cos(theta) / period) + y * (torch.sin(theta) / period)) % 1
     grating = grating.where(grating < 1 - 1e-10, 0.0)  # Avoid numerical issues from modulus
     return height * grating
 
@@ -95,20 +95,16 @@ def hermite_gaussian(
         True,
     )
 
-    u_x = 2.0**0.5 * x / wz
-    u_y = 2.0**0.5 * y / wz
+    # The amplitude is separable, so it is evaluated on a (H, 1) column and a (1, W) row of the meshgrid
+    u_x = 2.0**0.5 * x[:, :1] / wz
+    u_y = 2.0**0.5 * y[:1, :] / wz
     normalization_constant = torch.sqrt(
         2.0 ** (1 - m - n) / (math.factorial(m) * math.factorial(n) * torch.pi * waist_radius**2),
     )
+    amplitude_x = hermite_poly(m)(u_x) * torch.exp(-(u_x**2) / 2)
+    amplitude_y = hermite_poly(n)(u_y) * torch.exp(-(u_y**2) / 2)
 
-    return (
-        waist_ratio
-        * hermite_poly(m)(u_x)
-        * hermite_poly(n)(u_y)
-        * torch.exp(-(u_x**2 + u_y**2) / 2)
-        * torch.exp(1j * phase_shift)
-        * normalization_constant
-    )
+    return (waist_ratio * normalization_constant) * amplitude_x * amplitude_y * torch.exp(1j * phase_shift)
 
 
 def gaussian(
@@ -67,8 +67,7 @@ def circle(
     """
     radius = initialize_tensor("radius", radius, is_scalar=True, is_positive=True)
     x, y = profile_meshgrid(shape, spacing, offset)
-    r = torch.sqrt(x**2 + y**2)
-    return (r <= radius).to(get_default_dtype())
+    return (x**2 + y**2 <= radius**2).to(get_default_dtype())  # Compare squared radii to skip the sqrt
 
 
 def hexagon(
@@ -177,9 +176,9 @@ def regular_polygon(
         theta
         + (2 * torch.arange(num_sides, device=theta.device, dtype=theta.dtype) + 1) * math.pi / num_sides
     )
-    mask = torch.ones(x.shape, dtype=torch.bool, device=x.device)
-    for a in normals:
-        mask &= x * torch.cos(a) + y * torch.sin(a) <= apothem
+    # Project the grid onto all edge normals at once: shape (H, W, num_sides)
+    projections = x.unsqueeze(-1) * torch.cos(normals) + y.unsqueeze(-1) * torch.sin(normals)
+    mask = (projections <= apothem).all(dim=-1)
     return mask.to(get_default_dtype())
 
 
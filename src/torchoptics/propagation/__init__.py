@@ -7,6 +7,7 @@ from .propagator import (
     get_propagation_plane,
     is_angular_spectrum_method,
     propagator,
+    propagator_to_zs,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "get_propagation_plane",
     "is_angular_spectrum_method",
     "propagator",
+    "propagator_to_zs",
 ]
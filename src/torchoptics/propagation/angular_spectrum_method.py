@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 import torch
 from torch import Tensor
-from torch.fft import fft2, fftshift, ifft2, ifftshift
+from torch.fft import fft2, ifft2
 from torch.nn.functional import pad
 
 from ..functional import fftfreq_grad
@@ -47,38 +47,120 @@ def asm_propagation(
     return propagated_field
 
 
+def asm_propagation_to_zs(
+    field: Field,
+    z: Tensor,
+    propagation_method: str,
+    asm_pad: Vector2 | None,
+    batch_size: int | None = None,
+    paired: bool = False,
+) -> Tensor:
+    """Propagate the field to multiple planes along the z-axis using the angular spectrum method (ASM).
+
+    The padded field is transformed to the frequency domain once, and the transfer functions are applied to
+    ``batch_size`` propagation distances at a time. Only the cropped output planes are kept, so the padded
+    intermediates never exceed ``batch_size`` planes. Each output plane has the same ``shape``, ``spacing``,
+    and ``offset`` as the input field.
+
+    If ``paired`` is `True`, the first dimension of the field data indexes the planes, and ``field.data[i]``
+    is only propagated to ``z[i]``. This is used to apply the second half of a spatial coherence evolution.
+
+    Args:
+        field (Field): Input field.
+        z (Tensor): 1D tensor of positions along the z-axis.
+        propagation_method (str): Propagation method to use.
+        asm_pad (Vector2 | None): Padding size for ASM propagation.
+        batch_size (int | None): Number of planes propagated at once. Default: if `None`, all planes are
+            propagated at once.
+        paired (bool): Whether the first dimension of the field data is paired with ``z``. Default: `False`.
+
+    Returns:
+        Tensor: Propagated field data with shape ``(len(z), *field.data.shape)``, or ``field.data.shape`` if
+        ``paired`` is `True`.
+
+    """
+    if asm_pad is None:  # Default padding is 2x the input field size in each dimension
+        asm_pad = [2 * field.shape[0], 2 * field.shape[1]]
+    asm_pad = initialize_tensor("asm_pad", asm_pad, is_vector2=True, is_integer=True, is_non_negative=True)
+    pad_x, pad_y = int(asm_pad[0]), int(asm_pad[1])
+    num_planes = len(z)
+    batch_size = num_planes if batch_size is None else batch_size
+
+    padding = (pad_y, pad_y, pad_x, pad_x)
+    if not paired:
+        spectrum = fft2(pad(field.data, padding, mode="constant", value=0))  # Shared by all distances
+    propagation_distance = z - field.z
+
+    output_shape = field.data.shape if paired else (num_planes, *field.data.shape)
+    output_dtype = torch.promote_types(field.data.dtype, torch.complex64)
+    propagated_data = torch.empty(output_shape, dtype=output_dtype, device=field.data.device)
+    for start in range(0, num_planes, batch_size):
+        planes = slice(start, start + batch_size)
+        distance = propagation_distance[planes]
+        transfer_function = calculate_transfer_function(field, distance, asm_pad, propagation_method)
+        # Broadcast the transfer functions over the leading dimensions of the field data, which in paired
+        # mode already start with the plane dimension
+        transfer_function = transfer_function.view(
+            len(distance),
+            *(1,) * (field.data.ndim - 2 - int(paired)),
+            *transfer_function.shape[-2:],
+        )
+        if paired:
+            spectrum = fft2(pad(field.data[planes], padding, mode="constant", value=0))
+        batch_data = ifft2(spectrum * transfer_function)
+        propagated_data[planes] = batch_data[
+            ..., pad_x : pad_x + field.shape[0], pad_y : pad_y + field.shape[1]
+        ]
+    return propagated_data
+
+
 def calculate_transfer_function(
     field: Field,
     propagation_distance: Tensor,
     asm_pad: Tensor,
     propagation_method: str,
 ) -> Tensor:
-    """Calculate the transfer function for ASM propagation."""
+    """Calculate the transfer function for ASM propagation.
+
+    The transfer function is broadcast over the shape of ``propagation_distance``, i.e., the returned tensor
+    has shape ``(*propagation_distance.shape, H, W)``, with the spatial frequencies in FFT order (zero
+    frequency first, as returned by :func:`torch.fft.fftfreq`). It is assembled from its real magnitude and
+    phase with :func:`torch.polar`, which avoids building a complex exponent and evaluating a complex
+    exponential.
+
+    The constant phase :math:`k d` is factored out of the transfer function, so that the phase that varies
+    across the spatial frequencies does not lose precision next to a large constant. This keeps single
+    precision (``complex64``) propagation accurate over long distances.
+    """
     padded_input_shape = torch.tensor(field.shape) + 2 * asm_pad
-    freq_x, freq_y = (
-        fftshift(fftfreq_grad(n, d)) for n, d in zip(padded_input_shape, field.spacing, strict=False)
-    )
+    # Frequencies stay in FFT order so the transfer function multiplies the spectrum without shifting
+    freq_x, freq_y = (fftfreq_grad(n, d) for n, d in zip(padded_input_shape, field.spacing, strict=False))
     kx, ky = torch.meshgrid(freq_x * 2 * torch.pi, freq_y * 2 * torch.pi, indexing="ij")
     k = 2 * torch.pi / field.wavelength
+    propagation_distance = propagation_distance[..., None, None]
 
     if propagation_method.upper() in ("ASM", "AUTO"):  # Unnamed default uses Rayleigh-Sommerfeld (RS)
         kz_squared = (k**2 - kx**2 - ky**2) + 0j  # kz_squared is complex for sqrt calculation
         kz = torch.sqrt(kz_squared)  # kz is imaginary for evanescent waves where kz^2 < 0
-        return torch.exp(1j * kz * propagation_distance)
+        delta_kz = -(kx**2 + ky**2) / (kz + k)  # kz - k, computed without cancellation
+        # exp(i * kz * d) = exp(i * k * d) * exp(-Im(delta_kz) * d) * exp(i * Re(delta_kz) * d)
+        delta_kz_factor = torch.polar(
+            torch.exp(-delta_kz.imag * propagation_distance), delta_kz.real * propagation_distance
+        )
+        return torch.exp(1j * k * propagation_distance) * delta_kz_factor
 
     # Explicit _FRESNEL variants use the Fresnel approximation.
-    return torch.exp(1j * k * propagation_distance) * torch.exp(
-        -1j * field.wavelength * propagation_distance * (kx**2 + ky**2) / (4 * torch.pi),
-    )
+    # Apply the constant phase k * d separately so it does not reduce the precision of the quadratic phase
+    quadratic_phase = -field.wavelength * propagation_distance * (kx**2 + ky**2) / (4 * torch.pi)
+    quadratic_phase_factor = torch.polar(torch.ones_like(quadratic_phase), quadratic_phase)
+    return torch.exp(1j * k * propagation_distance) * quadratic_phase_factor
 
 
 def apply_transfer_function(transfer_function: Tensor, field: Field, asm_pad: Tensor) -> Tensor:
     """Apply the transfer function to the field for ASM propagation."""
     pad_x, pad_y = int(asm_pad[0]), int(asm_pad[1])
     data = pad(field.data, (pad_y, pad_y, pad_x, pad_x), mode="constant", value=0)
-    data = fftshift(fft2(data))
-    data = data * transfer_function
-    return ifft2(ifftshift(data))
+    return ifft2(fft2(data) * transfer_function)
 
 
 def validate_bounds(propagated_field: Field, target_plane: PlanarGrid, asm_pad: Vector2) -> None:
@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 import logging
+import warnings
 from typing import TYPE_CHECKING
 
 import torch
 
 from ..functional import plane_sample
 from ..planar_grid import PlanarGrid
-from .angular_spectrum_method import asm_propagation
+from ..utils import initialize_tensor
+from .angular_spectrum_method import asm_propagation, asm_propagation_to_zs
 from .direct_integration_method import calculate_grid_bounds, dim_propagation
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from torch import Tensor
+
     from ..fields import Field
     from ..types import Scalar, Vector2
 
@@ -63,17 +69,19 @@ def propagator(
         propagation_plane = get_propagation_plane(field, output_plane)
         is_asm = is_angular_spectrum_method(field, propagation_plane, propagation_method)
 
-        logger.debug("--- Propagating using %s method ---", "ASM" if is_asm else "DIM")
-        critical_z = calculate_critical_propagation_distance(field, propagation_plane)
-        logger.debug(
-            "Critical propagation distance: [%.2e, %.2e]",
-            critical_z[0].item(),
-            critical_z[1].item(),
-        )
-        if is_asm:
-            logger.debug("ASM padding: %s", asm_pad)
-        logger.debug("Input field plane: %s", field.geometry_str())
-        logger.debug("Propagation plane: %s", propagation_plane.geometry_str())
+        # The debug messages read tensor values back to the host, so they are only built when logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("--- Propagating using %s method ---", "ASM" if is_asm else "DIM")
+            critical_z = calculate_critical_propagation_distance(field, propagation_plane)
+            logger.debug(
+                "Critical propagation distance: [%.2e, %.2e]",
+                critical_z[0].item(),
+                critical_z[1].item(),
+            )
+            if is_asm:
+                logger.debug("ASM padding: %s", asm_pad)
+            logger.debug("Input field plane: %s", field.geometry_str())
+            logger.debug("Propagation plane: %s", propagation_plane.geometry_str())
 
         if is_asm:
             field = asm_propagation(field, propagation_plane, propagation_method, asm_pad)
@@ -84,12 +92,78 @@ def propagator(
         transformed_data = plane_sample(field.data, field, output_plane, interpolation_mode)
         field = field.copy(data=transformed_data, spacing=output_plane.spacing, offset=output_plane.offset)
 
-        logger.debug("--- Interpolating to output plane geometry ---")
-        logger.debug("Output plane: %s", output_plane.geometry_str())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("--- Interpolating to output plane geometry ---")
+            logger.debug("Output plane: %s", output_plane.geometry_str())
 
     return field
 
 
+def propagator_to_zs(
+    field: Field,
+    z: Tensor | Sequence[Scalar],
+    propagation_method: str,
+    asm_pad: Vector2 | None,
+    batch_size: int | None = None,
+    paired: bool = False,
+) -> Tensor:
+    """Propagate the field through free-space to multiple planes along the z-axis.
+
+    Each plane has the same ``shape``, ``spacing``, and ``offset`` as the input field. The propagation is
+    performed with the angular spectrum method (ASM), which allows the forward Fourier transform of the field
+    to be shared across all ``z`` positions (see :func:`asm_propagation_to_zs`).
+
+    ASM is only accurate up to the critical propagation distance (see
+    :func:`calculate_critical_propagation_distance`), beyond which the transfer function is undersampled and
+    the propagated field aliases. A :class:`UserWarning` is issued if the farthest plane is beyond it in both
+    planar dimensions, where :func:`propagator` with `"AUTO"` would select the direct integration method.
+
+    Args:
+        field (Field): Input field.
+        z (Tensor | Sequence[Scalar]): 1D sequence of positions along the z-axis.
+        propagation_method (str): Propagation method to use. Must be `"ASM"` or `"ASM_FRESNEL"`.
+        asm_pad (Vector2 | None): Padding size for ASM propagation.
+        batch_size (int | None): Number of planes propagated at once. Default: if `None`, all planes are
+            propagated at once.
+        paired (bool): Whether the first dimension of the field data is paired with ``z``, so that
+            ``field.data[i]`` is only propagated to ``z[i]``. Default: `False`.
+
+    Returns:
+        Tensor: Propagated field data with shape ``(len(z), *field.data.shape)``, or ``field.data.shape`` if
+        ``paired`` is `True`.
+
+    """
+    validate_propagation_method(propagation_method)
+    if propagation_method.upper() not in ("ASM", "ASM_FRESNEL"):
+        msg = f"Expected propagation_method to be 'ASM' or 'ASM_FRESNEL', but got {propagation_method}."
+        raise ValueError(msg)
+    z = initialize_tensor("z", z).to(field.data.device)
+    if z.ndim != 1:
+        msg = f"Expected z to be a 1D tensor, but got a tensor with shape {z.shape}."
+        raise ValueError(msg)
+    if len(z) == 0:
+        msg = "Expected z to contain at least one position."
+        raise ValueError(msg)
+    if batch_size is not None and (not isinstance(batch_size, int) or batch_size <= 0):
+        msg = f"Expected batch_size to be a positive integer, but got {batch_size}."
+        raise ValueError(msg)
+    if paired and (field.data.ndim == field.DATA_MIN_NDIM or field.data.shape[0] != len(z)):
+        msg = f"Expected field data with a leading dimension of size {len(z)}, but got {field.data.shape}."
+        raise ValueError(msg)
+    if not paired:  # Paired propagations repeat the distances of an earlier call
+        critical_z = calculate_critical_propagation_distance(field, field)
+        max_distance = (z - field.z).abs().max()
+        if torch.all(max_distance >= critical_z):
+            formatted_critical_z = [f"{val:.2e}" for val in critical_z.tolist()]
+            msg = (
+                f"Propagation distance {max_distance.item():.2e} exceeds the critical propagation distance "
+                f"{formatted_critical_z}, beyond which ASM aliases. Use propagate_to_z() with "
+                "propagation_method='AUTO' for the planes beyond it."
+            )
+            warnings.warn(msg, stacklevel=3)
+    return asm_propagation_to_zs(field, z, propagation_method, asm_pad, batch_size, paired)
+
+
 def get_propagation_plane(field: Field, output_plane: PlanarGrid) -> PlanarGrid:
     r"""Create a propagation plane that is equal to or slightly larger than the specified output plane.
 
@@ -4,13 +4,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, overload
 
+import torch
 from torch.nn import Module
 
 from .elements import Element, IdentityElement
 from .fields import Field
+from .utils import initialize_tensor
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
+
+    from torch import Tensor
 
     from .planar_grid import PlanarGrid
     from .types import Scalar, Vector2
@@ -24,8 +28,8 @@ class System(Module):
     each element applies its own transformation via :meth:`~torchoptics.elements.Element.forward`.
     The output from the final element is returned.
 
-    Field measurements at arbitrary planes can be performed using :meth:`measure`, :meth:`measure_at_z`, or
-    :meth:`measure_at_plane`.
+    Field measurements at arbitrary planes can be performed using :meth:`measure`, :meth:`measure_at_z`,
+    :meth:`measure_at_zs`, or :meth:`measure_at_plane`.
 
     Indexing with ``system[i]`` returns the i-th optical element. Slicing, e.g. ``system[i:j]``,
     returns a new :class:`System` containing the selected elements.
@@ -185,6 +189,82 @@ class System(Module):
             interpolation_mode=interpolation_mode,
         )
 
+    def measure_at_zs(
+        self,
+        field: Field,
+        z: Tensor | Sequence[Scalar],
+        *,
+        propagation_method: str = "AUTO",
+        asm_pad: Vector2 | None = None,
+        interpolation_mode: str = "nearest",
+    ) -> Tensor:
+        """Propagate the field through the system to planes at multiple z positions.
+
+        Equivalent to calling :meth:`measure_at_z` for each position, but the field is carried through the
+        system in a single pass ordered by ``z``: each element is applied once, and each measurement plane is
+        reached by propagating from the nearest preceding element.
+
+        The planes have the same ``shape``, ``spacing``, and ``offset`` as the input field.
+
+        Args:
+            field (Field): Input field.
+            z (Tensor | Sequence[Scalar]): 1D sequence of positions along the z-axis.
+            propagation_method (str): The propagation method to use. Default: `"AUTO"`.
+            asm_pad (Vector2 | None): The padding size along both planar dimensions for ASM propagation.
+                Default: if `None`, pads by 2x the input field size in each dimension.
+            interpolation_mode (str): The interpolation mode to use. Default: `"nearest"`.
+
+        Returns:
+            Tensor: Measured field data with shape ``(len(z), *field.data.shape)``.
+
+        """
+        z = initialize_tensor("z", z)
+        if z.ndim != 1:
+            msg = f"Expected z to be a 1D tensor, but got a tensor with shape {z.shape}."
+            raise ValueError(msg)
+        if torch.any(z < field.z.cpu()):
+            msg = f"Field z ({field.z}) is greater than the minimum measurement z ({z.min()})."
+            raise ValueError(msg)
+
+        elements = [element for element in self.sorted_elements() if field.z <= element.z]
+        measurements: dict[int, Tensor] = {}
+        current_field = field
+        element_index = 0
+
+        for i in torch.argsort(z).tolist():
+            plane_z = z[i]
+            while element_index < len(elements) and elements[element_index].z <= plane_z:
+                element = elements[element_index]
+                is_last = element_index + 1 == len(elements) or elements[element_index + 1].z > plane_z
+                if is_last and isinstance(element, IdentityElement):
+                    break  # Trailing IdentityElement is replaced by the measurement plane, as in measure()
+                current_field = current_field.propagate_to_plane(
+                    element,
+                    propagation_method=propagation_method,
+                    asm_pad=asm_pad,
+                    interpolation_mode=interpolation_mode,
+                )
+                current_field = element(current_field)
+                if not isinstance(current_field, Field):
+                    msg = (
+                        f"Expected all elements before the last measurement plane to return a Field. "
+                        f"Element {type(element).__name__} returned {type(current_field).__name__}."
+                    )
+                    raise TypeError(msg)
+                element_index += 1
+
+            measurements[i] = current_field.propagate(
+                field.shape,
+                plane_z,
+                field.spacing,
+                field.offset,
+                propagation_method=propagation_method,
+                asm_pad=asm_pad,
+                interpolation_mode=interpolation_mode,
+            ).data
+
+        return torch.stack([measurements[i] for i in range(len(z))])
+
     def measure_at_plane(
         self,
         field: Field,
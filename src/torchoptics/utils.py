@@ -53,7 +53,10 @@ def initialize_tensor(
         dtype = torch.complex128 if default_dtype == torch.float64 else torch.complex64
     else:
         dtype = default_dtype
-    tensor = value.clone().to(dtype) if isinstance(value, Tensor) else torch.tensor(value, dtype=dtype)
+    if isinstance(value, Tensor):  # Contiguous copy so strided views do not slow down FFT/pointwise kernels
+        tensor = value.clone(memory_format=torch.contiguous_format).to(dtype)
+    else:
+        tensor = torch.tensor(value, dtype=dtype)
 
     if is_scalar:
         if tensor.numel() != 1:
@@ -1,17 +1,24 @@
-"""Visualization utilities for real or complex-valued tensors using matplotlib."""
+"""Visualization utilities for real or complex-valued tensors using matplotlib.
 
-from collections.abc import Sequence
-from typing import cast
+Matplotlib is imported when a visualization function is first called rather than at module import, so that
+``import torchoptics`` does not initialize the pyplot backend and font manager.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
 
-import matplotlib.pyplot as plt
 import torch
-from matplotlib.animation import FuncAnimation
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
-from matplotlib.image import AxesImage
-from mpl_toolkits.axes_grid1 import make_axes_locatable
 from torch import Tensor
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from matplotlib.animation import FuncAnimation
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.image import AxesImage
+
 
 def visualize_tensor(
     tensor: Tensor,
@@ -42,6 +49,8 @@ def visualize_tensor(
         plt.Figure | None: The matplotlib Figure if `return_fig` is True, else None.
 
     """
+    import matplotlib.pyplot as plt
+
     if tensor.ndim < 2 or not all(s == 1 for s in tensor.shape[:-2]):
         msg = f"Expected tensor to be 2D, but got shape {tensor.shape}."
         raise ValueError(msg)
@@ -108,7 +117,7 @@ def visualize_tensor(
 
 def animate_tensor(
     tensor: Tensor,
-    title: str | Sequence[str] | None = None,
+    title: str | Sequence[str] | Callable[[int], str] | None = None,
     xlabel: str | None = None,
     ylabel: str | None = None,
     symbol: str | None = None,
@@ -123,7 +132,9 @@ def animate_tensor(
 
     Args:
         tensor (Tensor): A 3D tensor of shape (T, H, W).
-        title (str | Sequence[str] | None): Title for each frame, or a static title.
+        title (str | Sequence[str] | Callable[[int], str] | None): Title for each frame, a static title, or a
+            function that returns the title of a given frame index. A function is only called when its frame
+            is drawn, so the titles are not all built upfront.
         xlabel (str | None): Label for the x-axis.
         ylabel (str | None): Label for the y-axis.
         symbol (str | None): Symbol used in subplot titles for LaTeX rendering.
@@ -136,6 +147,9 @@ def animate_tensor(
         FuncAnimation: The matplotlib animation object.
 
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
     if tensor.ndim < 3 or not all(s == 1 for s in tensor.shape[:-3]):
         msg = f"Expected tensor to be 3D, but got shape {tensor.shape}."
         raise ValueError(msg)
@@ -144,15 +158,20 @@ def animate_tensor(
     num_frames = tensor.shape[0]
     is_complex = tensor.is_complex()
 
-    titles = [title] * num_frames if isinstance(title, str) or title is None else list(title)
+    if callable(title):
+        frame_title = title
+    else:
+        titles = [title] * num_frames if isinstance(title, str) or title is None else list(title)
 
-    if len(titles) != num_frames:
-        msg = f"`title` must have length {num_frames}, but got {len(titles)}."
-        raise ValueError(msg)
+        if len(titles) != num_frames:
+            msg = f"`title` must have length {num_frames}, but got {len(titles)}."
+            raise ValueError(msg)
+
+        frame_title = titles.__getitem__
 
     fig = visualize_tensor(
         tensor[0],
-        title=titles[0],
+        title=frame_title(0),
         xlabel=xlabel,
         ylabel=ylabel,
         symbol=symbol,
@@ -176,8 +195,9 @@ def animate_tensor(
         else:
             ims[0].set_array(tensor[frame])
 
-        if titles[frame]:
-            fig.suptitle(titles[frame], y=0.95)  # type: ignore[arg-type]
+        current_title = frame_title(frame)
+        if current_title:
+            fig.suptitle(current_title, y=0.95)
 
     anim = FuncAnimation(fig, update, frames=num_frames, **(func_anim_kwargs or {}))  # type: ignore[arg-type]
 
@@ -214,6 +234,9 @@ def create_image_subplot(
         AxesImage: The image object returned by `imshow`.
 
     """
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.axes_grid1 import make_axes_locatable
+
     imshow_kwargs.setdefault("cmap", "inferno")
 
     im = ax.imshow(tensor, **imshow_kwargs)
@@ -38,3 +38,10 @@ def test_beam_splitter():
     assert isinstance(bs_polarized_field1, torchoptics.Field)
     assert torch.allclose(bs_polarized_field0.intensity(), 2 * polarized_field.intensity())
     assert torch.allclose(bs_polarized_field1.intensity(), 0 * polarized_field.intensity())
+
+    # Two fields with broadcastable batch shapes
+    unbatched_field = torchoptics.Field(torch.ones(shape, shape), wavelength=700e-9, spacing=1e-5)
+    bs_field0, bs_field1 = bs.forward(unbatched_field, field)
+    assert bs_field0.data.shape == bs_field1.data.shape == (3, shape, shape)
+    assert torch.allclose(bs_field0.intensity(), 2 * field.intensity())
+    assert torch.allclose(bs_field1.intensity(), 0 * field.intensity())
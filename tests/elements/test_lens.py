@@ -1,7 +1,10 @@
+import pytest
 import torch
 
 from torchoptics import Field
+from torchoptics.config import get_default_dtype, set_default_dtype
 from torchoptics.elements import Lens
+from torchoptics.profiles import circle, lens_phase
 
 
 def test_lens():
@@ -16,3 +19,24 @@ def test_lens():
     field = Field(torch.ones(3, *shape), wavelength=wavelength, spacing=spacing)
     output_field = lens(field)
     assert isinstance(output_field, Field)
+
+
+@pytest.mark.parametrize(
+    ("dtype", "complex_dtype"), [(torch.float32, torch.complex64), (torch.float64, torch.complex128)]
+)
+def test_lens_modulation_profile(dtype, complex_dtype):
+    shape = (64, 64)
+    focal_length = 50.0
+    wavelength = 500e-9
+    spacing = 1e-5
+    original_dtype = get_default_dtype()
+    try:
+        set_default_dtype(dtype)
+        lens = Lens(shape, focal_length, 0, spacing)
+        profile = lens.modulation_profile(wavelength)
+        assert profile.dtype == complex_dtype
+        phase = lens_phase(shape, focal_length, wavelength, spacing)
+        amplitude = circle(shape, lens.length().min() / 2, spacing)
+        assert torch.allclose(profile, amplitude * torch.exp(1j * phase))
+    finally:
+        set_default_dtype(original_dtype)
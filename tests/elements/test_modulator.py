@@ -101,6 +101,19 @@ def test_amplitude_modulation_profile_consistency():
     amplitude_modulator = AmplitudeModulator(amplitude_profile, z)
     modulator = Modulator(amplitude_profile.to(torch.cfloat), z)
     assert torch.allclose(modulator.modulation_profile(), amplitude_modulator.modulation_profile())
+    field = Field(torch.randn(3, 10, 12, dtype=torch.cfloat), wavelength=700e-9, z=z, spacing=1)
+    assert torch.allclose(amplitude_modulator(field).data, modulator(field).data)
+
+
+def test_amplitude_modulator_subclass_profile():
+    class HalfAmplitudeModulator(AmplitudeModulator):
+        def modulation_profile(self):
+            return super().modulation_profile() / 2
+
+    amplitude_profile = torch.rand((10, 12))
+    field = Field(torch.randn(3, 10, 12, dtype=torch.cfloat), wavelength=700e-9, spacing=1)
+    output_field = HalfAmplitudeModulator(amplitude_profile, spacing=1)(field)
+    assert torch.allclose(output_field.data, field.data * amplitude_profile / 2)
 
 
 def test_error_on_invalid_tensor_input():
@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 import pytest
 import torch
@@ -6,22 +8,25 @@ from scipy.special import fresnel
 
 from torchoptics import Field, PlanarGrid, SpatialCoherence
 from torchoptics.propagation import VALID_PROPAGATION_METHODS, is_angular_spectrum_method
+from torchoptics.propagation.angular_spectrum_method import calculate_transfer_function
 
 # Helper for gaussian_2d
 
 
 def gaussian_2d(x, y, sigma_x, sigma_y, mu_x, mu_y):
+    # The Gaussian is separable, so it is evaluated on a (H, 1) column and a (1, W) row of the "ij" meshgrid
     coefficient = 1 / (2 * torch.pi * sigma_x * sigma_y)
-    exponent = -((x - mu_x) ** 2 / (2 * sigma_x**2) + (y - mu_y) ** 2 / (2 * sigma_y**2))
-    return coefficient * torch.exp(exponent)
+    gaussian_x = torch.exp(-((x[:, :1] - mu_x) ** 2) / (2 * sigma_x**2))
+    gaussian_y = torch.exp(-((y[:1, :] - mu_y) ** 2) / (2 * sigma_y**2))
+    return coefficient * gaussian_x * gaussian_y
 
 
 def analytical_square_aperture_field(x, L, N_f, wavelength, propagation_distance):
     S_minus, C_minus = fresnel((2 * N_f) ** 0.5 * (1 - 2 * x / L))
     S_plus, C_plus = fresnel((2 * N_f) ** 0.5 * (1 + 2 * x / L))
     Integral = 1 / 2**0.5 * (C_minus + C_plus) + 1j / 2**0.5 * (S_minus + S_plus)
-    xv, yv = np.meshgrid(Integral, Integral)
-    field = np.exp(1j * 2 * np.pi / wavelength * propagation_distance) / 1j * xv * yv
+    phase = np.exp(1j * 2 * np.pi / wavelength * propagation_distance) / 1j
+    field = phase * np.multiply.outer(Integral, Integral)
     return field
 
 
@@ -44,6 +49,13 @@ def test_field_initialization():
         Field(torch.ones(10), spacing=1, wavelength=1)
 
 
+def test_field_intensity():
+    data = torch.randn(2, 10, 11, dtype=torch.cfloat)
+    field = Field(data, spacing=1, wavelength=1)
+    assert torch.allclose(field.intensity(), data.abs().square())
+    assert torch.allclose(field.power(), data.abs().square().sum(dim=(-1, -2)))
+
+
 def test_field_centroid_and_std():
     shape = (1001, 1000)
     z = 0
@@ -62,31 +74,40 @@ def test_field_centroid_and_std():
     assert torch.allclose(std, torch.tensor([sigma_x, sigma_y]), atol=1e-3)
 
 
-def test_field_propagation_square_aperture():
-    shape = 201
-    spacing = 5e-6
-    wavelength = 800e-9
-    propagation_distance = 0.05
-    devices = ["cpu", "cuda"] if torch.cuda.is_available() else ["cpu"]
-    for device in devices:
-        for propagation_method in VALID_PROPAGATION_METHODS:
-            square_field = torch.ones(shape, shape, device=device)
-            input_field = Field(
-                square_field.to(torch.cfloat),
-                spacing=spacing,
-                wavelength=wavelength,
-            ).to(device)
-            output_field = input_field.propagate(
-                (shape, shape),
-                propagation_distance,
-                spacing=spacing,
-                propagation_method=propagation_method,
-            )
-            x = np.linspace(-spacing * shape / 2, spacing * shape / 2, shape)
-            L = (shape - 1) * spacing
-            N_f = (L / 2) ** 2 / (wavelength * propagation_distance)
-            analytical_field = analytical_square_aperture_field(x, L, N_f, wavelength, propagation_distance)
-            assert np.allclose(output_field.data.cpu(), analytical_field, atol=2e-1)
+SQUARE_APERTURE_SHAPE = 201
+SQUARE_APERTURE_SPACING = 5e-6
+SQUARE_APERTURE_WAVELENGTH = 800e-9
+SQUARE_APERTURE_DISTANCE = 0.05
+DEVICES = ["cpu", "cuda"] if torch.cuda.is_available() else ["cpu"]
+
+
+@pytest.fixture(scope="module")
+def analytical_square_aperture():
+    shape, spacing = SQUARE_APERTURE_SHAPE, SQUARE_APERTURE_SPACING
+    wavelength, propagation_distance = SQUARE_APERTURE_WAVELENGTH, SQUARE_APERTURE_DISTANCE
+    x = np.linspace(-spacing * shape / 2, spacing * shape / 2, shape)
+    L = (shape - 1) * spacing
+    N_f = (L / 2) ** 2 / (wavelength * propagation_distance)
+    return analytical_square_aperture_field(x, L, N_f, wavelength, propagation_distance)
+
+
+@pytest.mark.parametrize("propagation_method", sorted(VALID_PROPAGATION_METHODS))
+@pytest.mark.parametrize("device", DEVICES)
+def test_field_propagation_square_aperture(device, propagation_method, analytical_square_aperture):
+    shape = SQUARE_APERTURE_SHAPE
+    square_field = torch.ones(shape, shape, dtype=torch.cfloat, device=device)
+    input_field = Field(
+        square_field,
+        spacing=SQUARE_APERTURE_SPACING,
+        wavelength=SQUARE_APERTURE_WAVELENGTH,
+    ).to(device)
+    output_field = input_field.propagate(
+        (shape, shape),
+        SQUARE_APERTURE_DISTANCE,
+        spacing=SQUARE_APERTURE_SPACING,
+        propagation_method=propagation_method,
+    )
+    assert np.allclose(output_field.data.cpu(), analytical_square_aperture, atol=2e-1)
 
 
 def test_field_offset():
@@ -178,16 +199,14 @@ def test_field_asm_propagation():
         )
 
 
-def test_field_asm_propagation_zero_pad():
-    shapes = [(100, 100), (1, 100), (100, 1), (1, 1)]
-    spacings = [1e-6, 500e-9]
+@pytest.mark.parametrize("spacing", [1e-6, 500e-9])
+@pytest.mark.parametrize("shape", [(100, 100), (1, 100), (100, 1), (1, 1)])
+def test_field_asm_propagation_zero_pad(shape, spacing):
     wavelength = 700e-9
     propagation_distance = 1
-    for shape in shapes:
-        for spacing in spacings:
-            field = Field(torch.ones(shape, dtype=torch.cfloat), spacing=spacing, wavelength=wavelength)
-            field_prop = field.propagate_to_z(propagation_distance, propagation_method="asm", asm_pad=0)
-            assert pytest.approx(field.power().item()) == field_prop.power().item()
+    field = Field(torch.ones(shape, dtype=torch.cfloat), spacing=spacing, wavelength=wavelength)
+    field_prop = field.propagate_to_z(propagation_distance, propagation_method="asm", asm_pad=0)
+    assert pytest.approx(field.power().item()) == field_prop.power().item()
 
 
 def test_field_asm_pad():
@@ -240,14 +259,89 @@ def test_field_asm_pad():
     assert torch.allclose(output_field1.data, output_field2.data)
 
 
+def test_field_propagate_to_zs():
+    field = Field(torch.ones(20, 21, dtype=torch.cfloat), spacing=1e-6, wavelength=700e-9, z=0.1)
+    z_values = torch.tensor([0.1, 0.2, 0.35, 0.5])
+    for propagation_method in ("ASM", "ASM_FRESNEL"):
+        data = field.propagate_to_zs(z_values, propagation_method=propagation_method)
+        assert data.shape == (4, 20, 21)
+        for i, z in enumerate(z_values):
+            expected = field.propagate_to_z(z, propagation_method=propagation_method).data
+            assert torch.allclose(data[i], expected, atol=1e-5)
+
+    batched_field = Field(torch.ones(3, 20, 21, dtype=torch.cfloat), spacing=1e-6, wavelength=700e-9)
+    batched_data = batched_field.propagate_to_zs([0.1, 0.2], asm_pad=0)
+    assert batched_data.shape == (2, 3, 20, 21)
+    assert torch.allclose(batched_data[1, 2], batched_field.propagate_to_z(0.2, asm_pad=0).data[2], atol=1e-5)
+
+    expected_data = field.propagate_to_zs(z_values)
+    for batch_size in (1, 3, 4):
+        assert torch.allclose(field.propagate_to_zs(z_values, batch_size=batch_size), expected_data)
+
+    with pytest.raises(ValueError):
+        field.propagate_to_zs(z_values, propagation_method="DIM")
+    with pytest.raises(ValueError):
+        field.propagate_to_zs(torch.ones(2, 2))
+    with pytest.raises(ValueError):
+        field.propagate_to_zs(z_values, batch_size=0)
+    with pytest.raises(ValueError, match="at least one position"):
+        field.propagate_to_zs(torch.empty(0))
+
+
+def test_field_propagate_to_zs_critical_distance():
+    # Critical propagation distance is 2 * 19e-6 * 1e-6 / 700e-9 ~= 5.4e-5
+    field = Field(torch.ones(20, 20, dtype=torch.cfloat), spacing=1e-6, wavelength=700e-9)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        field.propagate_to_zs([1e-5, 5e-5])
+    with pytest.warns(UserWarning, match="critical propagation distance"):
+        field.propagate_to_zs([1e-5, 1e-4])
+
+
+def test_calculate_transfer_function():
+    # Grid extends into the evanescent region (spatial frequencies above 1 / wavelength)
+    field = Field(torch.ones(10, 10), spacing=0.1, wavelength=1)
+    asm_pad = torch.tensor([5, 5])
+    propagation_distance = torch.tensor([-1.0, 0.0, 2.5], dtype=torch.double)
+    freq_x, freq_y = (torch.fft.fftfreq(20, 0.1, dtype=torch.double) for _ in range(2))
+    kx, ky = torch.meshgrid(2 * torch.pi * freq_x, 2 * torch.pi * freq_y, indexing="ij")
+    k = 2 * torch.pi
+    d = propagation_distance[:, None, None]
+
+    transfer_function = calculate_transfer_function(field, propagation_distance, asm_pad, "ASM")
+    expected = torch.exp(1j * torch.sqrt((k**2 - kx**2 - ky**2) + 0j) * d)
+    assert transfer_function.shape == (3, 20, 20)
+    assert torch.allclose(transfer_function, expected)
+
+    transfer_function = calculate_transfer_function(field, propagation_distance, asm_pad, "ASM_FRESNEL")
+    expected = torch.exp(1j * k * d) * torch.exp(-1j * d * (kx**2 + ky**2) / (4 * torch.pi))
+    assert torch.allclose(transfer_function, expected)
+
+
+def test_field_propagation_debug_logging(caplog):
+    field = Field(torch.ones(10, 10), spacing=1, wavelength=1)
+    with caplog.at_level("INFO", logger="torchoptics.propagation.propagator"):
+        field.propagate(12, 1, 1)
+    assert not caplog.records
+    with caplog.at_level("DEBUG", logger="torchoptics.propagation.propagator"):
+        field.propagate(12, 1, 1)
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("Critical propagation distance" in message for message in messages)
+    assert any("Interpolating to output plane geometry" in message for message in messages)
+
+
+@pytest.mark.parametrize("interpolation_mode", ["nearest", "bilinear", "bicubic"])
+def test_field_interpolation_mode(interpolation_mode):
+    field = Field(torch.ones(100, 100, dtype=torch.cfloat), 500e-9, spacing=1e-6)
+    field.propagate_to_z(1, interpolation_mode=interpolation_mode)
+
+
 def test_field_interpolation_modes():
     shape = (100, 100)
     spacing = 1e-6
     wavelength = 500e-9
     data = torch.ones(shape, dtype=torch.cfloat)
     field = Field(data, wavelength, spacing=spacing)
-    for mode in ["nearest", "bilinear", "bicubic"]:
-        field.propagate_to_z(1, interpolation_mode=mode)
     with pytest.raises(ValueError):
         field.propagate_to_z(1, interpolation_mode="invalid_mode")
     with pytest.raises(TypeError):
@@ -306,6 +400,17 @@ def test_field_modulate():
     assert torch.allclose(modulated_field.data, 10 * torch.ones(10, 10, dtype=torch.cfloat))
 
 
+def test_field_polarized_modulate_uniform_profile():
+    field = Field(torch.randn(2, 3, 8, 9, dtype=torch.cfloat), spacing=1, wavelength=1)
+    matrix = torch.randn(3, 3, dtype=torch.cfloat)
+    expanded_profile = matrix[..., None, None].expand(3, 3, 8, 9)
+    dense_profile = expanded_profile.contiguous()
+    expected = (field.data.unsqueeze(-4) * dense_profile).sum(-3)
+    assert torch.allclose(field.polarized_modulate(dense_profile).data, expected, atol=1e-6)
+    assert torch.allclose(field.polarized_modulate(expanded_profile).data, expected, atol=1e-6)
+    assert torch.allclose(field.polarized_modulate(matrix[..., None, None]).data, expected, atol=1e-6)
+
+
 def test_field_normalization():
     field = Field(torch.rand(10, 10), spacing=10e-6, wavelength=800e-9)
     normalized_field = field.normalize(2)
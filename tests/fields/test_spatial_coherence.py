@@ -50,6 +50,14 @@ def test_spatial_coherence_incorrect_shape():
         ).intensity()
 
 
+def test_spatial_coherence_intensity_imaginary_diagonal():
+    _, _, _, input_spatial_coherence, _, wavelength, z, spacing, offset = make_spatial_coherence_fixture()
+    with pytest.raises(ValueError):
+        SpatialCoherence(1j * input_spatial_coherence, wavelength, z, spacing, offset).intensity()
+    with pytest.raises(ValueError):
+        SpatialCoherence(input_spatial_coherence * float("nan"), wavelength, z, spacing, offset).intensity()
+
+
 def test_spatial_coherence_intensity_equal_field_coherent():
     field, spatial_coherence, *_ = make_spatial_coherence_fixture()
     assert torch.allclose(field.intensity(), spatial_coherence.intensity())
@@ -80,6 +88,16 @@ def test_spatial_coherence_propagation_intensity():
     assert prop_field.is_same_geometry(prop_spatial_coherence)
 
 
+def test_spatial_coherence_propagate_to_zs():
+    field, spatial_coherence, *_ = make_spatial_coherence_fixture()
+    z_values = [0.01, 0.02]
+    field_data = field.propagate_to_zs(z_values, asm_pad=0)
+    coherence_data = spatial_coherence.propagate_to_zs(z_values, asm_pad=0, batch_size=1)
+    assert coherence_data.shape == (len(z_values), *spatial_coherence.data.shape)
+    for i in range(len(z_values)):
+        assert torch.allclose(coherence_data[i], outer2d(field_data[i], field_data[i]))
+
+
 def test_spatial_coherence_normalization_coherent():
     field, spatial_coherence, *_ = make_spatial_coherence_fixture()
     normalized_power = 2.53
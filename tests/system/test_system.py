@@ -123,6 +123,25 @@ def test_measure_at_plane():
     assert torch.allclose(measure_plane.data, measure.data)
 
 
+def test_measure_at_zs():
+    shape, spacing, wavelength, propagation_distance = 50, 5e-6, 800e-9, 0.01
+    input_field = Field(torch.ones(shape, shape, dtype=torch.cfloat), spacing=spacing, wavelength=wavelength)
+    system = System(
+        Modulator(torch.exp(1j * torch.rand(shape, shape)), propagation_distance, spacing),
+        IdentityElement(shape, 2 * propagation_distance, 6e-6),
+        Modulator(torch.exp(1j * torch.rand(shape, shape)), 3 * propagation_distance, spacing),
+    )
+    z_values = torch.tensor([4, 0, 1, 2.5, 2, 3]) * propagation_distance
+    measurements = system.measure_at_zs(input_field, z_values)
+    assert measurements.shape == (len(z_values), shape, shape)
+    for measurement, z in zip(measurements, z_values):
+        assert torch.allclose(measurement, system.measure_at_z(input_field, z).data, atol=1e-5)
+    with pytest.raises(ValueError):
+        system.measure_at_zs(input_field.copy(z=propagation_distance), z_values)
+    with pytest.raises(ValueError):
+        system.measure_at_zs(input_field, torch.ones(2, 2))
+
+
 def test_identity_element():
     shape, spacing, _, propagation_distance, _, _, _, _, _, input_field, _ = make_system_setup()
     system = System(IdentityElement(shape, z=propagation_distance, spacing=spacing))
@@ -47,6 +47,13 @@ def test_initialize_vector2_from_scalar_tensor_preserves_device():
     assert tensor.device == scalar.device
 
 
+def test_initialize_tensor_is_contiguous():
+    value = torch.rand(4, 6).T
+    tensor = initialize_tensor("tensor", value)
+    assert tensor.is_contiguous()
+    assert torch.equal(tensor, value.to(tensor.dtype))
+
+
 def test_initialize_complex_tensor():
     tensor = initialize_tensor("complex", 1.0 + 2.0j, is_complex=True)
     assert torch.is_tensor(tensor)
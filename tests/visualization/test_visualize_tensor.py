@@ -1,5 +1,6 @@
 from unittest.mock import patch
 
+import matplotlib.pyplot as plt
 import pytest
 import torch
 from matplotlib.animation import Animation, FuncAnimation
@@ -121,6 +122,26 @@ def test_animate_tensor_with_titles():
             animate_tensor(tensor, title=titles_incorrect, show=True)
 
 
+def test_animate_tensor_with_callable_title():
+    with patch("matplotlib.pyplot.show"):
+        tensor = torch.rand(5, 10, 10)
+        requested_frames = []
+
+        def title(frame: int) -> str:
+            requested_frames.append(frame)
+            return f"Frame {frame}"
+
+        anim = animate_tensor(tensor, title=title, show=True)
+        fig = plt.gcf()
+        assert isinstance(anim, Animation)
+        assert requested_frames == [0]
+        assert [text.get_text() for text in fig.texts] == ["Frame 0"]
+
+        anim.to_jshtml()  # Draws every frame
+        assert set(requested_frames) == set(range(5))
+        assert [text.get_text() for text in fig.texts] == ["Frame 4"]
+
+
 def test_animate_tensor_extra_imshow_kwargs():
     tensor = torch.rand(5, 10, 10)
     func_anim_kwargs = {"interval": 500}